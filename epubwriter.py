@@ -0,0 +1,91 @@
+"""
+Streaming EPUB writing.
+
+Classes:
+    StreamingEpubWriter: An ebooklib EpubWriter that writes chapters to the archive
+    as they are built.
+"""
+import os
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from ebooklib import epub
+
+class StreamingEpubWriter(epub.EpubWriter):
+    """An EpubWriter that stores each chapter as soon as it is finished.
+
+    ebooklib's write_epub only starts writing once the whole book is built,
+    so every chapter's content stays in memory until the end. Here chapters
+    are compressed into the archive as they are added and their content is
+    released; only the package document, the NCX and the navigation are
+    written at the end, and those need nothing but each item's metadata.
+
+    Serialising a chapter (lxml) and deflating it (zlib) mostly run in C
+    without the GIL, so that happens on a single background thread while the
+    caller goes on building the next chapter. One thread keeps the archive
+    entries in the order the chapters were added. A chapter's serialisation
+    reads nothing from the book but its templates and language, which are set
+    before the first chapter is written.
+
+    This builds on EpubWriter's internals (out, process, _write_container,
+    _write_opf and the item loop of _write_items), which is why requirements.txt
+    pins EbookLib to 0.18.x.
+    """
+
+    # Emptied chapters can't be scanned for page breaks, and feed chapters
+    # have none, so the navigation carries no page list
+    OPTIONS = {'epub3_pages': False}
+
+    def __init__(self, file_name: str, book: epub.EpubBook):
+        super().__init__(file_name, book, self.OPTIONS)
+        self._written: set[int] = set()
+        self._pending: list[Future] = []
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._finished = False
+        self.out = zipfile.ZipFile(file_name, 'w', zipfile.ZIP_DEFLATED, allowZip64=True)
+        self.out.writestr('mimetype', 'application/epub+zip',
+                          compress_type=zipfile.ZIP_STORED)
+        self._write_container()
+
+    def write_item(self, item: epub.EpubItem) -> None:
+        """Queue an item that was added to the book to be stored, then drop its content."""
+        self._written.add(id(item))
+        self._pending.append(self._executor.submit(self._store_item, item))
+
+    def _store_item(self, item: epub.EpubItem) -> None:
+        """Compress an item into the archive and release its content."""
+        self.out.writestr(f"{self.book.FOLDER_NAME}/{item.file_name}", item.get_content())
+        item.content = b""
+
+    def _write_items(self) -> None:
+        """Write every item of the book that wasn't already streamed into the archive."""
+        folder = self.book.FOLDER_NAME
+        for item in self.book.get_items():
+            if id(item) in self._written:
+                continue
+            if isinstance(item, epub.EpubNcx):
+                self.out.writestr(f"{folder}/{item.file_name}", self._get_ncx())
+            elif isinstance(item, epub.EpubNav):
+                self.out.writestr(f"{folder}/{item.file_name}", self._get_nav(item))
+            elif item.manifest:
+                self.out.writestr(f"{folder}/{item.file_name}", item.get_content())
+            else:
+                self.out.writestr(item.file_name, item.get_content())
+
+    def finish(self, output_file: str) -> None:
+        """Write the remaining items and move the finished archive to output_file."""
+        # Surface the first error from the queued chapters, if any
+        for future in self._pending:
+            future.result()
+        self.process()
+        self._write_opf()
+        self._write_items()
+        self.out.close()
+        os.replace(self.file_name, output_file)
+        self._finished = True
+
+    def close(self) -> None:
+        """Close the archive, discarding it unless finish() succeeded."""
+        self._executor.shutdown(wait=True)
+        self.out.close()
+        if not self._finished and os.path.exists(self.file_name):
+            os.remove(self.file_name)
@@ -7,19 +7,201 @@ Classes:
     Such as adding, removing, editing, parsing, and so on.
 """
 import os
+import copy
 import json
-from dataclasses import dataclass, asdict
+import time
+import atexit
+import pickle
+import shelve
+import hashlib
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from collections import deque, OrderedDict
+from collections.abc import Iterator
+from html import escape
+from urllib.parse import urljoin
 
 import feedparser
-from newspaper import Article as FullText
+import requests
+from feedparser.sanitizer import _sanitize_html
+from feedparser.urls import resolve_relative_uris
+from bs4 import UnicodeDammit
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from logger import _setup_logger
 
+try:
+    import orjson
+except ImportError:  # Optional, only makes (de)serialising faster
+    orjson = None
+
+# Upper bound on the number of feeds fetched at the same time
+MAX_FEED_WORKERS = 8
+# Upper bound on the number of full articles downloaded at the same time, across all feeds
+MAX_ARTICLE_WORKERS = 16
+# Seconds to wait for a server before giving up on a feed or article
+REQUEST_TIMEOUT = 10
+# Seconds to wait for more feed edits before writing the configuration file
+SAVE_DELAY = 0.2
+# Seconds a fetched feed is reused as is, without asking its server again
+FEED_CACHE_TTL = 300
+# Number of feeds whose entries are kept in memory between fetches
+FEED_CACHE_SIZE = 128
+# Bumped whenever the shape or cleaning of cached feed entries changes
+ENTRIES_CACHE_VERSION = 3
+# Number of full article texts kept on disk between runs
+ARTICLE_CACHE_SIZE = 5000
+
+
+def _json_loads(data: bytes):
+    """Decode JSON with orjson when it is installed, falling back to the standard library."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode indented JSON as UTF-8 with orjson when it is installed.
+
+    Both encoders give the same layout, two-space indents and non-ASCII
+    characters as is, since orjson can't indent any other way.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+# Qualified Atom tag names, spelled out once rather than per entry
+_ATOM_FEED = f"{_ATOM_NS}feed"
+_ATOM_ENTRY = f"{_ATOM_NS}entry"
+_ATOM_LINK = f"{_ATOM_NS}link"
+_ATOM_SUMMARY = f"{_ATOM_NS}summary"
+_ATOM_CONTENT = f"{_ATOM_NS}content"
+_ATOM_TITLE = f"{_ATOM_NS}title"
+_ATOM_PUBLISHED = f"{_ATOM_NS}published"
+_ATOM_AUTHOR_NAME = f"{_ATOM_NS}author/{_ATOM_NS}name"
+_XHTML_DIV = "{http://www.w3.org/1999/xhtml}div"
+
+
+def _clean_html(markup: str | None, base_url: str) -> str | None:
+    """Make feed-supplied HTML safe to embed, the way feedparser does for its entries.
+
+    Relative links and image sources are resolved against the feed URL, then
+    scripts, event handlers and anything else outside feedparser's allow list
+    are stripped.
+    """
+    if not markup:
+        return markup
+    markup = resolve_relative_uris(markup, base_url, "utf-8", "text/html")
+    return _sanitize_html(markup, "utf-8", "text/html")
+
+
+def _fast_parse(data: bytes, base_url: str) -> list[dict] | None:
+    """Extract the entries of a well-formed RSS 2.0 or Atom feed with lxml.
+
+    Only the fields the generator uses are read, into plain dicts keyed like
+    feedparser's entries (title, link, summary, published, author), so the rest
+    of the code doesn't care which parser produced them. Summaries go through
+    the same relative link resolution and sanitising feedparser applies, and
+    links are resolved against base_url.
+
+    Args:
+        data: The raw feed document.
+        base_url: The URL the feed was fetched from.
+
+    Returns:
+        The feed entries, or None if the document is neither RSS 2.0 nor Atom.
+
+    Raises:
+        etree.XMLSyntaxError: If the document isn't well-formed XML.
+    """
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    root = etree.fromstring(data, parser)
+
+    entries = []
+    if root.tag == "rss":
+        for item in root.iterfind("channel/item"):
+            link = item.findtext("link")
+            if not link:
+                guid = item.find("guid")
+                if guid is not None and guid.get("isPermaLink", "true") != "false":
+                    link = guid.text
+            entry = {
+                "title": item.findtext("title"),
+                "link": urljoin(base_url, link.strip()) if link else link,
+                "summary": _clean_html(item.findtext("description"), base_url),
+                "published": item.findtext("pubDate"),
+                "author": item.findtext("author") or item.findtext(_DC_CREATOR),
+            }
+            entries.append({key: value.strip() for key, value in entry.items() if value})
+    elif root.tag == _ATOM_FEED:
+        for item in root.iterfind(_ATOM_ENTRY):
+            link = None
+            for link_element in item.iterfind(_ATOM_LINK):
+                if link_element.get("rel", "alternate") == "alternate":
+                    link = link_element.get("href")
+                    break
+            summary = item.find(_ATOM_SUMMARY)
+            if summary is None:
+                summary = item.find(_ATOM_CONTENT)
+            entry = {
+                "title": item.findtext(_ATOM_TITLE),
+                "link": urljoin(base_url, link.strip()) if link else link,
+                "summary": _atom_text(summary, base_url),
+                "published": item.findtext(_ATOM_PUBLISHED),
+                "author": item.findtext(_ATOM_AUTHOR_NAME),
+            }
+            entries.append({key: value.strip() for key, value in entry.items() if value})
+    else:
+        return None
+
+    return entries
+
+
+def _atom_text(element, base_url: str) -> str | None:
+    """Return an Atom text construct as HTML safe to embed.
+
+    HTML and inline XHTML are cleaned like feedparser does, plain text (the
+    default type) is escaped so it reads as written.
+    """
+    if element is None:
+        return None
+    content_type = element.get("type", "text")
+    if content_type in ("xhtml", "application/xhtml+xml"):
+        # Like feedparser, leave out the div the spec wraps inline XHTML in
+        children = list(element)
+        if len(children) == 1 and children[0].tag == _XHTML_DIV:
+            element = children[0]
+        return _clean_html(
+            (element.text or "")
+            + "".join(etree.tostring(child, encoding="unicode") for child in element),
+            base_url)
+    if content_type in ("html", "text/html"):
+        return _clean_html(element.text, base_url)
+    return escape(element.text) if element.text else element.text
+
+
 @dataclass
 class FeedConfig:
     """Configuration for a single RSS feed."""
     url: str
     name: str | None
     num_articles: int = 5
+    # Validators from the last successful fetch, sent back for conditional GETs
+    etag: str | None = None
+    modified: str | None = None
+
+
+def _dump_feeds(feeds: list[FeedConfig]) -> bytes:
+    """Encode feed configurations as the indented JSON stored in feeds.json."""
+    # FeedConfig is flat, its __dict__ serialises as is without asdict's deep copy
+    return _json_dumps([vars(feed) for feed in feeds])
+
 
 @dataclass
 class Article:
@@ -31,6 +213,129 @@ class Article:
     author: str | None
     text: str | None # Full text obtained by Newspaper4k
 
+
+def _make_article(entry) -> Article | None:
+    """Build an Article from a feed entry, or return None if the entry has no link."""
+    get = entry.get
+    link = get("link")
+    if not link:
+        return None
+    return Article(
+        title=get("title", "No Title"),
+        link=link,
+        summary=get("summary"),
+        # Fetch publication date if possible
+        published=get("published", "No Date"),
+        # Fetch article author if possible
+        author=get("author", "Unknown Author"),
+        text=None
+    )
+
+
+class _ArticleCache:
+    """Full article texts kept on disk across runs, least recently used dropped first.
+
+    The texts live in a shelve keyed by a hash of the article URL. Some dbm
+    backends, dbm.sqlite3 (the default from Python 3.13) among them, may only
+    be used from the thread that opened them, so a single thread owns the shelve
+    and every lookup and store is handed to it. Any failure of the cache itself
+    is logged and treated as a miss.
+    """
+
+    # Shelve key holding the usage order of the cached texts, oldest first.
+    # Text keys are hex digests, so it can't collide with one of them.
+    _ORDER_KEY = "_lru"
+
+    def __init__(self, path: str, max_entries: int, logger):
+        self.max_entries = max_entries
+        self.logger = logger
+        self._requests: queue.SimpleQueue = queue.SimpleQueue()
+        # Guards _closed, so nothing is queued after the close request
+        self._lock = threading.Lock()
+        self._closed = False
+        opened: Future = Future()
+        threading.Thread(target=self._run, args=(path, opened),
+                         name="ArticleCache", daemon=True).start()
+        self.available = opened.result()
+        if self.available:
+            atexit.register(self.close)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached text for key, or None on a miss."""
+        result: Future = Future()
+        if not self._submit("get", key, None, result):
+            return None
+        return result.result()
+
+    def put(self, key: str, text: str) -> None:
+        """Queue a text to be stored under key, without waiting for the write."""
+        self._submit("put", key, text, None)
+
+    def close(self) -> None:
+        """Write out the usage order and close the shelve, waiting for pending stores."""
+        done: Future = Future()
+        if self._submit("close", None, None, done):
+            done.result()
+
+    def _submit(self, op: str, key: str | None, text: str | None,
+                result: Future | None) -> bool:
+        """Hand a request to the cache thread, unless the cache is closed or unavailable."""
+        with self._lock:
+            if not self.available or self._closed:
+                return False
+            self._closed = op == "close"
+            self._requests.put((op, key, text, result))
+            return True
+
+    def _run(self, path: str, opened: Future) -> None:
+        """Own the shelve: open it, then serve requests until closed."""
+        try:
+            shelf = shelve.open(path, writeback=False)
+            order = OrderedDict.fromkeys(shelf.get(self._ORDER_KEY, ()))
+            # Texts stored after the order was last written count as the oldest
+            for key in shelf.keys():
+                if key not in order and key != self._ORDER_KEY:
+                    order[key] = None
+                    order.move_to_end(key, last=False)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            # Most likely another process holds the database, just go without
+            self.logger.warning("Article cache unavailable: %s", e)
+            opened.set_result(False)
+            return
+        opened.set_result(True)
+
+        while True:
+            op, key, text, result = self._requests.get()
+            if op == "close":
+                try:
+                    shelf[self._ORDER_KEY] = list(order)
+                    shelf.close()
+                # pylint: disable=broad-exception-caught
+                except Exception as e:
+                    self.logger.warning("Failed to close the article cache: %s", e)
+                result.set_result(None)
+                return
+            try:
+                if op == "get":
+                    text = shelf.get(key)
+                    if text is not None:
+                        order[key] = None
+                        order.move_to_end(key)
+                    result.set_result(text)
+                else:
+                    shelf[key] = text
+                    order[key] = None
+                    order.move_to_end(key)
+                    while len(order) > self.max_entries:
+                        shelf.pop(order.popitem(last=False)[0], None)
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                self.logger.warning("Article cache %s failed: %s", op, e)
+                if result is not None and not result.done():
+                    result.set_result(None)
+
+
 class FeedHandler:
     """
     The class responsible for handling and managing RSS feeds.
@@ -40,6 +345,8 @@ class FeedHandler:
 
     Attributes:
         json_path (str): The path to the JSON file that stores feed configurations.
+        cache_dir (str): The directory holding the last parsed entries of each feed,
+            and the full text of already downloaded articles.
         feeds_data (list[FeedConfig]): A list of feed configurations.
         logger (Logger): A logger instance to keep track of what's happening.
 
@@ -52,20 +359,35 @@ class FeedHandler:
             If the file doesn't exist, it creates an empty file and logs the necessary information.
         
         save_feeds() -> None:
-            Saves the current feed configurations back to the JSON file.
+            Atomically saves the current feed configurations back to the JSON file.
+
+        flush() -> None:
+            Writes out any feed changes still waiting to be saved.
         
         add_feed(feed_config: FeedConfig) -> None:
-            Adds a new feed to the internal list and updates the JSON file.
+            Adds a new feed to the internal list and schedules a save of the JSON file.
         
         remove_feed(url: str) -> None:
-            Removes a feed from the list based on the provided URL and updates the JSON file.
+            Removes a feed from the list based on the provided URL and schedules a save.
         
         update_feed(url: str, feed_config: FeedConfig) -> None:
-            Updates an existing feed by URL and saves the changes to the JSON file.
+            Updates an existing feed by URL and schedules a save of the changes.
+
+        has_feed(url: str) -> bool:
+            Checks whether a feed with the given URL is configured.
+
+        get_feed(url: str) -> FeedConfig | None:
+            Returns the configuration of the feed with the given URL, if any.
         
-        parse_feed(feed_config: FeedConfig) -> list[Article]:
+        parse_feed(feed_config: FeedConfig, full_text: bool = True) -> list[Article]:
             Parses an RSS feed using the provided feed configuration and returns a list of articles.
             Handles potential feed parsing errors and logs warnings or errors accordingly.
+
+        iter_articles(feed_config: FeedConfig, full_text: bool = True) -> Iterator[Article]:
+            Same as parse_feed, but streams the articles as their full text arrives.
+
+        iter_feeds(feeds: list[FeedConfig], full_text: bool = True) -> list[Iterator[Article]]:
+            Parses several RSS feeds concurrently and streams their articles in feed order.
 """
     def __init__(self, json_path: str):
         """Initialize the FeedHandler with a path to the feeds configuration file.
@@ -74,34 +396,84 @@ class FeedHandler:
             json_path: Path to the JSON file containing feed configurations.
         """
         self.json_path = json_path
+        self.cache_dir = os.path.join(os.path.dirname(json_path), "cache")
         self.feeds_data: list[FeedConfig] = []
+        # Position of each feed in feeds_data, keyed by URL
+        self._url_index: dict[str, int] = {}
         self.logger = _setup_logger("FeedHandler")
         self.logger.info("FeedHandler Initialised. ")
         self.load_feeds()
 
+        # Edits only flag a pending save, a background thread coalesces them
+        self._save_lock = threading.Lock()
+        self._save_pending = threading.Event()
+        self._last_saved: tuple[int, str] | None = None
+        threading.Thread(target=self._save_worker, name="FeedHandlerSaver",
+                         daemon=True).start()
+        atexit.register(self.flush)
+
+        # Newspaper4k settings for full text extraction, built the first time an
+        # article is downloaded: importing the library alone takes about half a
+        # second, which summary-only runs and GUI startup shouldn't pay
+        self._np_config = None
+        self._np_config_lock = threading.Lock()
+
+        # One keep-alive connection pool for feeds and articles alike, so the
+        # TCP and TLS handshakes are paid once per host rather than per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Full article downloads from every feed share this pool
+        self._fulltext_pool = ThreadPoolExecutor(max_workers=MAX_ARTICLE_WORKERS)
+
+        # Recently fetched entries keyed by feed URL, with the time they were
+        # fetched, least recently used first
+        self._recent_entries: OrderedDict[str, tuple[float, list]] = OrderedDict()
+        self._recent_lock = threading.Lock()
+
+        # Full article text keyed by a hash of the article URL, shared across runs
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            self.logger.warning("Cache directory unavailable: %s", e)
+        self._article_cache = _ArticleCache(os.path.join(self.cache_dir, "articles.db"),
+                                            ARTICLE_CACHE_SIZE, self.logger)
+
     def load_feeds(self) -> None:
         """Load and validate RSS feed metadata from the JSON file."""
 
-        # Ensure the directory exists
-        directory = os.path.dirname(self.json_path)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-            self.logger.info("Created directory: %s", directory)
-
-        # Ensure the JSON file exists
-        if not os.path.isfile(self.json_path):
-            with open(self.json_path, 'w', encoding='utf-8') as file:
-                json.dump([], file, ensure_ascii=False, indent=4)
+        # Just try to open the file, creating it only when that fails, rather than
+        # stat'ing the directory and the file first on every load
+        try:
+            # pylint: disable=consider-using-with
+            file = open(self.json_path, 'rb')
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(self.json_path) or '.', exist_ok=True)
+            with open(self.json_path, 'wb') as new_file:
+                new_file.write(b'[]')
             self.logger.info("Created empty JSON file: %s", self.json_path)
             self.feeds_data = []
+            self._url_index = {}
             return
 
         try:
-            with open(self.json_path, 'r', encoding='utf-8') as file:
-                raw_data = json.load(file)
-                self.feeds_data = [
-                    FeedConfig(**feed_data) for feed_data in raw_data
-                ]
+            with file:
+                raw_data = _json_loads(file.read())
+            # URLs identify feeds (and the GUI's rows), so only the first feed
+            # with a given URL is kept; older versions and hand edits allowed repeats
+            feeds_data = []
+            url_index = {}
+            for feed_data in raw_data:
+                feed = FeedConfig(**feed_data)
+                if feed.url in url_index:
+                    self.logger.warning("Ignoring duplicate feed with URL: %s", feed.url)
+                    continue
+                url_index[feed.url] = len(feeds_data)
+                feeds_data.append(feed)
+            self.feeds_data = feeds_data
+            self._url_index = url_index
             self.logger.info("Successfully loaded %d feeds",
                             len(self.feeds_data))
         except json.JSONDecodeError as e:
@@ -112,98 +484,388 @@ class FeedHandler:
             raise
 
     def save_feeds(self) -> None:
-        """Save the current feed configurations to the JSON file."""
-        try:
-            with open(self.json_path, 'w', encoding='utf-8') as file:
-                json.dump([asdict(feed)
-                          for feed in self.feeds_data], file, indent=4)
-            self.logger.info("Successfully saved %d feeds",
-                             len(self.feeds_data))
-        except IOError as e:
-            self.logger.error("Failed to save feeds: %s", e)
-            raise
+        """Save the current feed configurations to the JSON file.
+
+        The file is written to a temporary path and renamed over the original,
+        so a crash mid-write never leaves a truncated configuration behind.
+        The write is skipped when the file still holds exactly this content.
+        """
+        with self._save_lock:
+            # Encoded under the lock, so saves from the background saver and a
+            # generation run are written in the order their content was taken
+            payload = _dump_feeds(self.feeds_data)
+            digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+            try:
+                if self._last_saved == (os.stat(self.json_path).st_mtime_ns, digest):
+                    self.logger.debug("Feeds unchanged, skipped saving")
+                    return
+            except FileNotFoundError:
+                pass
+
+            tmp_path = self.json_path + ".tmp"
+            try:
+                with open(tmp_path, 'wb') as file:
+                    file.write(payload)
+                os.replace(tmp_path, self.json_path)
+                self._last_saved = (os.stat(self.json_path).st_mtime_ns, digest)
+                self.logger.info("Successfully saved %d feeds",
+                                 len(self.feeds_data))
+            except IOError as e:
+                self.logger.error("Failed to save feeds: %s", e)
+                raise
+
+    def flush(self) -> None:
+        """Save the feed configurations now if a save is pending."""
+        if self._save_pending.is_set():
+            self._save_pending.clear()
+            self.save_feeds()
+
+    def _schedule_save(self) -> None:
+        """Ask the background thread to save the feed configurations."""
+        self._save_pending.set()
+
+    def _save_worker(self) -> None:
+        """Background loop writing out bursts of feed edits as a single save."""
+        while True:
+            self._save_pending.wait()
+            time.sleep(SAVE_DELAY)
+            try:
+                self.flush()
+            except IOError:
+                # Already logged, the next edit will try again
+                pass
 
     def add_feed(self, feed_config: FeedConfig) -> None:
         """Add a new feed configuration."""
         self.feeds_data.append(feed_config)
-        self.save_feeds()
+        self._url_index[feed_config.url] = len(self.feeds_data) - 1
+        self._schedule_save()
 
     def remove_feed(self, url: str) -> None:
         """Remove a feed configuration by URL."""
-        self.feeds_data = [feed for feed in self.feeds_data if feed.url != url]
-        self.save_feeds()
+        i = self._url_index.pop(url, None)
+        if i is not None:
+            del self.feeds_data[i]
+            # Feeds after the removed one moved up a slot, keeping their order
+            for j in range(i, len(self.feeds_data)):
+                self._url_index[self.feeds_data[j].url] = j
+        self._schedule_save()
 
     def update_feed(self, url: str, feed_config: FeedConfig) -> None:
         """Update an existing feed configuration by URL."""
-        for i, feed in enumerate(self.feeds_data):
-            if feed.url == url:
-                self.feeds_data[i] = feed_config
-                break
+        i = self._url_index.get(url)
+        if i is not None:
+            self.feeds_data[i] = feed_config
+            if feed_config.url != url:
+                del self._url_index[url]
+                self._url_index[feed_config.url] = i
         else:
             self.logger.info("No feed with specified URL Nothing was updated")
-        self.save_feeds()
+        self._schedule_save()
+
+    def has_feed(self, url: str) -> bool:
+        """Check whether a feed with the given URL is configured."""
+        return url in self._url_index
+
+    def get_feed(self, url: str) -> FeedConfig | None:
+        """Get the configuration of the feed with the given URL, or None."""
+        i = self._url_index.get(url)
+        return None if i is None else self.feeds_data[i]
 
-    def parse_feed(self, feed_config: FeedConfig) -> list[Article]:
+    def parse_feed(self, feed_config: FeedConfig, full_text: bool = True) -> list[Article]:
         """Parse an RSS feed and return a list of articles.
 
         Args:
             feed_config: Configuration for the feed to parse.
+            full_text: Whether to download each article and extract its full text.
+                Without it, articles only carry the summary from the feed.
 
         Returns:
             List of parsed articles.
         """
+        return list(self.iter_articles(feed_config, full_text))
 
-        articles = []
+    def iter_articles(self, feed_config: FeedConfig,
+                      full_text: bool = True) -> Iterator[Article]:
+        """Parse an RSS feed and stream its articles.
 
-        parsed_feed = feedparser.parse(feed_config.url)
-        # Check if we get a 200
-        if hasattr(parsed_feed, 'status') and parsed_feed.status != 200:
-            self.logger.warning(
-                "Feed %s returned status %d. Possible issue with the feed URL.",
-                feed_config.url, parsed_feed.status)
-            return articles
-        # Check if feed format is funky
-        if parsed_feed.bozo:
+        The feed is fetched and every full article download is started before
+        this returns; the iterator then hands out the articles in feed order as
+        their text arrives, so a consumer only ever needs to hold one of them.
+
+        Args:
+            feed_config: Configuration for the feed to parse.
+            full_text: Whether to download each article and extract its full text.
+
+        Returns:
+            An iterator over the parsed articles.
+        """
+        entries = self._fetch_entries(feed_config)
+        if entries is None:
+            return iter(())
+
+        entries = entries[:feed_config.num_articles]
+        articles = [article for article in map(_make_article, entries)
+                    if article is not None]
+        if len(articles) < len(entries):
+            self.logger.warning("Skipped %d entries without a link in %s",
+                                len(entries) - len(articles), feed_config.url)
+
+        if full_text:
+            # Downloads run on the shared pool, alongside those of other feeds
+            futures = [self._fulltext_pool.submit(self._fetch_full_text, article.link)
+                       for article in articles]
+        else:
+            futures = [None] * len(articles)
+
+        return self._stream_articles(feed_config, deque(zip(articles, futures)))
+
+    def _stream_articles(self, feed_config: FeedConfig,
+                         pending: deque) -> Iterator[Article]:
+        """Yield articles as their full text downloads complete, letting go of each one."""
+        count = 0
+        failed = []
+        while pending:
+            article, future = pending.popleft()
+            if future is not None:
+                article.text = future.result()
+                if article.text is None:
+                    failed.append(article.link)
+                    article.text = "Error parsing full article content."
+            count += 1
+            yield article
+
+        if failed:
             self.logger.warning(
-                "Feed %s has possible invalid format: %s. Bozo flag set.",
-                feed_config.url, parsed_feed.bozo_exception)
-            return articles
+                "Newspaper library failed to parse %d full articles in feed %s: %s",
+                len(failed), feed_config.url, failed[:3])
+        self.logger.info("Parsed %d articles from feed %s",
+                        count, feed_config.url)
 
-        for entry in parsed_feed.entries[:feed_config.num_articles]:
-            try:
-                # Fetch publication date if possible
-                published = entry.get("published", "No Date")
-                # Fetch article author if possible
-                author = entry.get("author", "Unknown Author")
-                # Fetch full article text
-                text = None
+    def _fetch_entries(self, feed_config: FeedConfig) -> list | None:
+        """Get the entries of a feed, from memory if it was fetched in the last few minutes.
+
+        Generating several books in one session would otherwise ask every
+        server again each time, for feeds that rarely change within minutes.
+
+        Args:
+            feed_config: Configuration for the feed to fetch.
+
+        Returns:
+            The feed entries, or None if the feed could not be fetched or parsed.
+        """
+        url = feed_config.url
+        with self._recent_lock:
+            recent = self._recent_entries.get(url)
+            if recent is not None and time.monotonic() - recent[0] < FEED_CACHE_TTL:
+                self._recent_entries.move_to_end(url)
+                self.logger.info("Feed %s fetched recently, reusing its entries", url)
+                return recent[1]
+
+        entries = self._download_entries(feed_config)
+        if entries is not None:
+            with self._recent_lock:
+                self._recent_entries[url] = (time.monotonic(), entries)
+                self._recent_entries.move_to_end(url)
+                if len(self._recent_entries) > FEED_CACHE_SIZE:
+                    self._recent_entries.popitem(last=False)
+        return entries
+
+    def _download_entries(self, feed_config: FeedConfig) -> list | None:
+        """Fetch the entries of a feed, reusing the cached ones when it hasn't changed.
+
+        The stored ETag and Last-Modified values are sent along with the request,
+        so an unchanged feed answers 304 Not Modified with an empty body and the
+        entries pickled after the previous fetch are returned instead.
+
+        Args:
+            feed_config: Configuration for the feed to fetch. Its etag and modified
+                fields are updated in place after a successful fetch.
+
+        Returns:
+            The feed entries, or None if the feed could not be fetched or parsed.
+        """
+        cache_path = self._entries_cache_path(feed_config.url)
+
+        try:
+            response = self._get_feed(feed_config.url, feed_config.etag, feed_config.modified)
+            if response.status_code == 304:
                 try:
-                    full_article = FullText(entry.link)
-                    full_article.download()
-                    body = full_article.parse()
-                    text = body.text
-                # pylint: disable=broad-exception-caught
-                except Exception as e:
+                    with open(cache_path, 'rb') as file:
+                        entries = pickle.load(file)
+                    self.logger.info("Feed %s not modified, using cached entries",
+                                     feed_config.url)
+                    return entries
+                except (OSError, pickle.UnpicklingError, EOFError) as e:
                     self.logger.warning(
-                        "Newspaper library Error parsing full article for URL %s: %s",
-                        entry.link, e)
-                    text = "Error parsing full article content."
-
-                article = Article(
-                    title=entry.get("title", "No Title"),
-                    link=entry.get("link", ""),
-                    summary=entry.get("summary"),
-                    published=published,
-                    author=author,
-                    text=text
-                )
-                articles.append(article)
-            except AttributeError as e:
+                        "Cached entries for %s unavailable (%s). Fetching again.",
+                        feed_config.url, e)
+                    response = self._get_feed(feed_config.url)
+        except requests.RequestException as e:
+            self.logger.warning("Failed to fetch feed %s: %s", feed_config.url, e)
+            return None
+
+        # Check if we get a 200
+        if response.status_code != 200:
+            self.logger.warning(
+                "Feed %s returned status %d. Possible issue with the feed URL.",
+                feed_config.url, response.status_code)
+            return None
+
+        # Plain RSS 2.0 and Atom go straight through lxml, anything else or
+        # anything malformed is left to feedparser's forgiving parser
+        try:
+            entries = _fast_parse(response.content, response.url)
+        except etree.XMLSyntaxError:
+            entries = None
+
+        if entries is None:
+            headers = {key.lower(): value for key, value in response.headers.items()}
+            # Lets feedparser resolve relative links against the final URL
+            headers['content-location'] = response.url
+            parsed_feed = feedparser.parse(response.content, response_headers=headers)
+            # Check if feed format is funky
+            if parsed_feed.get('bozo'):
                 self.logger.warning(
-                    "Error parsing entry in %s: %s", feed_config.url, e)
-                continue
+                    "Feed %s has possible invalid format: %s. Bozo flag set.",
+                    feed_config.url, parsed_feed.get('bozo_exception'))
+                return None
+            entries = parsed_feed.entries
 
-        self.logger.info("Parsed %d articles from feed %s",
-                        len(articles), feed_config.url)
+        feed_config.etag = response.headers.get('ETag')
+        feed_config.modified = response.headers.get('Last-Modified')
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_path, 'wb') as file:
+                pickle.dump(entries, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError) as e:
+            # Without cached entries a 304 is useless, so don't ask for one next time
+            feed_config.etag = feed_config.modified = None
+            self.logger.warning("Failed to cache entries for %s: %s", feed_config.url, e)
 
-        return articles
+        return entries
+
+    def _get_feed(self, url: str, etag: str | None = None,
+                  modified: str | None = None) -> requests.Response:
+        """GET a feed through the shared session, conditionally if validators are given."""
+        headers = {"User-Agent": feedparser.USER_AGENT}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+        return self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+    def _entries_cache_path(self, url: str) -> str:
+        """Return the path of the pickle holding the cached entries for a feed URL."""
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        # Versioned so entries pickled before summaries were sanitised aren't reused
+        return os.path.join(self.cache_dir, f"{digest}.{ENTRIES_CACHE_VERSION}.pickle")
+
+    def _newspaper_config(self):
+        """Return the shared Newspaper4k settings, importing the library on first use.
+
+        Only the body text is used, so image probing, article memoization and
+        meta refreshes are all turned off.
+        """
+        with self._np_config_lock:
+            if self._np_config is None:
+                # pylint: disable=import-outside-toplevel
+                from newspaper import Config as NewspaperConfig
+                config = NewspaperConfig()
+                config.fetch_images = False
+                config.memorize_articles = False
+                config.follow_meta_refresh = False
+                config.clean_article_html = False
+                self._np_config = config
+            return self._np_config
+
+    def _fetch_full_text(self, link: str) -> str | None:
+        """Download an article and extract its full text with Newspaper4k.
+
+        Texts are cached on disk by URL, so an article seen in an earlier run or
+        republished by another feed is neither downloaded nor parsed again.
+        Runs on worker threads, the Newspaper library keeps no shared state
+        between Article instances.
+
+        Returns:
+            The article text, or None if it couldn't be downloaded or parsed.
+            Failures are only logged at debug level, parse_feed reports them per feed.
+        """
+        key = hashlib.blake2b(str(link).encode('utf-8'), digest_size=16).hexdigest()
+        cached = self._article_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            # pylint: disable=import-outside-toplevel
+            from newspaper import Article as FullText
+            np_config = self._newspaper_config()
+            response = self._session.get(
+                link, headers={"User-Agent": np_config.browser_user_agent},
+                timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            if "charset" in response.headers.get("Content-Type", "").lower():
+                html = response.text
+            else:
+                # requests would assume Latin-1, sniff the page like Newspaper4k does
+                html = UnicodeDammit(response.content, is_html=True).unicode_markup
+            # Newspaper4k sets the language it finds in the page's metadata on its
+            # config, so each thread gets its own copy of the shared settings
+            full_article = FullText(link, config=copy.copy(np_config))
+            full_article.download(input_html=html)
+            body = full_article.parse()
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            self.logger.debug(
+                "Newspaper library Error parsing full article for URL %s: %s",
+                link, e)
+            return None
+
+        self._article_cache.put(key, body.text)
+        return body.text
+
+    def iter_feeds(self, feeds: list[FeedConfig],
+                   full_text: bool = True) -> list[Iterator[Article]]:
+        """Parse several RSS feeds concurrently and stream their articles.
+
+        Fetching is almost entirely network-bound, so feeds are fetched on a
+        thread pool: the wall time becomes that of the slowest feed rather
+        than the sum of all of them. feedparser keeps no global parsing state
+        and each call builds its own result, so it is safe to use from threads.
+        Full article downloads keep running in the background while the
+        returned iterators are consumed.
+
+        Args:
+            feeds: Configurations for the feeds to parse.
+            full_text: Whether to download the full text of every article.
+
+        Returns:
+            One article iterator per feed, in the same order as feeds.
+            A feed that failed to parse yields no articles.
+        """
+        if not feeds:
+            return []
+
+        validators = [(feed.etag, feed.modified) for feed in feeds]
+        with ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(feeds))) as executor:
+            results = list(executor.map(self._iter_articles_safely, feeds,
+                                        repeat(full_text)))
+
+        # Persist the new ETag/Last-Modified values for the next run
+        if validators != [(feed.etag, feed.modified) for feed in feeds]:
+            self.save_feeds()
+
+        return results
+
+    def _iter_articles_safely(self, feed_config: FeedConfig,
+                              full_text: bool) -> Iterator[Article]:
+        """Start parsing a feed, logging and swallowing any error.
+
+        One bad feed can't sink the rest.
+        """
+        try:
+            return self.iter_articles(feed_config, full_text)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            self.logger.error("Failed to parse feed '%s': %s", feed_config.name, e)
+            return iter(())
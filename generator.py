@@ -1,24 +1,69 @@
 """
 Document generation module.
 """
+import copy
+import html
+import logging
 from datetime import date
-from typing import List
-from ebooklib import epub
+from functools import lru_cache
+from typing import Iterable
 
 from logger import _setup_logger
 from feedhandler import FeedConfig, FeedHandler
 
+# HTML opening a feed chapter
+_FEED_HEADING_TMPL = '<h1>{name}</h1>'
+# HTML for a single article within a feed chapter, every field is pre-escaped
+_ARTICLE_TMPL = (
+    '<h2 id="{id}">{title}</h2>'
+    '{author_meta}'
+    '<p><strong>Published:</strong> {published}</p>'
+    '<p><a href="{link}">Read original article</a></p>'
+    '<hr>'
+    '<p>{body}</p>'
+)
+# Stylesheet shared by every chapter, encoded once so writing it is a plain copy
+_NAV_CSS = """
+        @namespace html url(http://www.w3.org/1999/xhtml);
+        body { line-height: 1.6; }
+        h1, h2 { margin-bottom: 0.5em; }
+        a { text-decoration: underline; }
+        hr { border: none; }
+        """.encode('utf-8')
+# Author line of an article, the same for every article by that author
+_AUTHOR_META_TMPL = '<p><strong>Author:</strong> {author}</p>'
+
+@lru_cache(maxsize=256)
+def _author_meta(author: str) -> str:
+    """Render the author line shared by every article from the same author."""
+    return _AUTHOR_META_TMPL.format_map({'author': html.escape(author)})
 
 class EpubGenerator:
     """Generates EPUB files from a list of articles."""
 
     def __init__(self):
-        """Initialize the EpubGenerator with logging."""
+        """Initialize the EpubGenerator with logging and the shared book items."""
         self.logger = _setup_logger("EpubGenerator")
+
+        # Items identical in every book, built on the first generation and
+        # copied into each one after that
+        self._nav_css_template = None
+        self._ncx_template = None
+        self._nav_template = None
+
         self.logger.info("EpubGenerator Initialized. ")
 
+    def _build_templates(self) -> None:
+        """Build the items shared by every book."""
+        # pylint: disable=import-outside-toplevel
+        from ebooklib import epub
+        self._nav_css_template = epub.EpubItem(uid="style_nav", file_name="style/nav.css",
+                                               media_type="text/css", content=_NAV_CSS)
+        self._ncx_template = epub.EpubNcx()
+        self._nav_template = epub.EpubNav()
+
     def generate_epub(self,
-                    feeds: List[FeedConfig],
+                    feeds: Iterable[FeedConfig],
                     handler: FeedHandler,
                     output_file: str,
                     article_type: str) -> None:
@@ -26,11 +71,13 @@ class EpubGenerator:
         Generate an EPUB file from a list of articles.
 
         Args:
-            feeds: List of FeedConfig objects.
+            feeds: FeedConfig objects, in any iterable.
             handler: A FeedHandler instance to manage parsing.
             output_file: Path to the output EPUB file.
             article_type: Decides whether to generate using full articles, or summaries.
         """
+        # Configurations are small, only the articles they produce are streamed
+        feeds = list(feeds)
         if not feeds:
             self.logger.warning(
                 "No feeds provided. EPUB file will not be generated.")
@@ -42,123 +89,139 @@ class EpubGenerator:
 
         self.logger.info("Starting EPUB generation...")
 
+        # ebooklib is only needed once a book is actually built, keep it out
+        # of the startup of the GUI and anything else importing this module
+        # pylint: disable=import-outside-toplevel
+        from ebooklib import epub
+        from epubwriter import StreamingEpubWriter
+        if self._nav_css_template is None:
+            self._build_templates()
+
         # Create a new EPUB book
         book = epub.EpubBook()
         book.set_title(f"{date.today().isoformat()} Newspaper")
         book.set_language("en")
         book.add_author("Epistle")
 
-        # Define CSS styles
-        style = """
-        @namespace html url(http://www.w3.org/1999/xhtml);
-        body { line-height: 1.6; }
-        h1, h2 { margin-bottom: 0.5em; }
-        a { text-decoration: underline; }
-        hr { border: none; }
-        """
-        nav_css = epub.EpubItem(uid="style_nav", file_name="style/nav.css",
-                                media_type="text/css", content=style)
+        # Add CSS styles
+        nav_css = copy.copy(self._nav_css_template)
         book.add_item(nav_css)
 
-        # List to store chapters and articles
-        chapters = []
+        # Only the manifest ids of the written chapters are kept for the spine,
+        # their content is released once they are in the archive
+        chapter_ids = []
         toc = []
+        is_full = article_type == "Full"
+        log_articles = self.logger.isEnabledFor(logging.DEBUG)
 
-        for feed in feeds:
-            self.logger.info(
-                "Processing feed '%s' with URL: %s", feed.name, feed.url)
+        # Fetch every feed concurrently up front, the network is the bottleneck
+        # Summaries come with the feed, only download articles when they're shown in full
+        parsed_feeds = handler.iter_feeds(feeds, full_text=is_full)
+
+        # Chapters are compressed into a temporary archive as soon as they are
+        # built, it only replaces output_file once the book is complete
+        try:
+            writer = StreamingEpubWriter(output_file + ".part", book)
+        except OSError as e:
+            self.logger.error("Failed to save EPUB file: %s", e)
+            return
+
+        try:
+            for feed, articles in zip(feeds, parsed_feeds):
+                self.logger.info(
+                    "Processing feed '%s' with URL: %s", feed.name, feed.url)
+
+                # Create a single chapter for the entire feed
+                feed_title = feed.name or f"Feed_{feed.url}"
+                chapter_file = f"{feed_title.replace(' ', '_')}.xhtml"
+                feed_chapter = epub.EpubHtml(
+                    title=feed_title,
+                    file_name=chapter_file,
+                )
+                # Chapter HTML fragments, joined once the feed is done
+                parts = [_FEED_HEADING_TMPL.format_map(
+                    {'name': html.escape(feed.name or 'Unnamed Feed')})]
+
+                # List to store article links for the TOC
+                feed_toc = []
+
+                # Articles stream in as their downloads finish, only the rendered
+                # HTML is kept around
+                for article in articles:
+                    if not article.title:
+                        self.logger.warning(
+                            "Skipping article with missing title in feed '%s'.", feed.name)
+                        continue
+
+                    if log_articles:
+                        self.logger.debug(
+                            "Adding article '%s' from feed '%s'", article.title, feed.name)
+                    article_title = article.title or "Unnamed Article"
+                    article_id = article_title.replace(' ', '_')
+                    # Full text is plain text, summaries already come as HTML
+                    article_content = _ARTICLE_TMPL.format_map({
+                        'id': html.escape(article_id),
+                        'title': html.escape(article_title),
+                        'author_meta': _author_meta(article.author or 'Unknown Author'),
+                        'published': html.escape(article.published or 'Unknown Date'),
+                        'link': html.escape(article.link),
+                        'body': html.escape(article.text) if is_full else (
+                            article.summary or 'No content available.'),
+                    })
+                    parts.append(article_content)
+
+                    # Add article to TOC only if article_type is "Full"
+                    if is_full:
+                        article_link = epub.Link(
+                            href=f"{chapter_file}#{article_id}",
+                            title=article_title,
+                            uid=article_id
+                        )
+                        feed_toc.append(article_link)
+
+                if len(parts) == 1:
+                    self.logger.warning(
+                        "No articles found in feed '%s'. Skipping...", feed.name)
+                    continue
+                self.logger.info(
+                    "Added %d articles from feed '%s'", len(parts) - 1, feed.name)
+
+                # Add the feed chapter to the book
+                feed_chapter.content = "".join(parts)
+                book.add_item(feed_chapter)
+                writer.write_item(feed_chapter)
+                chapter_ids.append(feed_chapter.id)
+
+                # Add the feed and its articles to the TOC
+                if feed_toc:
+                    toc.append((epub.Section(feed_title), feed_toc))
+                else:
+                    toc.append(epub.Section(feed_title))
+
+            # Add navigation and spine
+            self.logger.info("Adding navigation and styling...")
 
-            # Parse feed
             try:
-                articles = handler.parse_feed(feed)
+                book.toc = toc
+                book.add_item(copy.copy(self._ncx_template))
+                book.add_item(copy.copy(self._nav_template))
+
+                book.spine = ("nav", *chapter_ids)
             # pylint: disable=broad-exception-caught
             except Exception as e:
                 self.logger.error(
-                    "Failed to parse feed '%s': %s", feed.name, e)
-                continue
-
-            if not articles:
-                self.logger.warning(
-                    "No articles found in feed '%s'. Skipping...", feed.name)
-                continue
-
-            # Create a single chapter for the entire feed
-            feed_title = feed.name or f"Feed_{feed.url}"
-            feed_content = f"<h1>{feed.name or 'Unnamed Feed'}</h1>"
-            feed_chapter = epub.EpubHtml(
-                title=feed_title,
-                file_name=f"{feed_title.replace(' ', '_')}.xhtml",
-                content=feed_content,
-            )
-
-            # List to store article links for the TOC
-            feed_toc = []
-
-            for article in articles:
-                if not article.title:
-                    self.logger.warning(
-                        "Skipping article with missing title in feed '%s'.", feed.name)
-                    continue
+                    "Failed to configure navigation and styling: %s", e)
+                return
 
+            # Write the book to a file
+            try:
+                writer.finish(output_file)
                 self.logger.info(
-                    "Adding article '%s' from feed '%s'", article.title, feed.name)
-                article_title = article.title or "Unnamed Article"
-                article_id = article_title.replace(' ', '_')
-                article_content = f"""
-                <h2 id="{article_id}">{article_title}</h2>
-                <p><strong>Author:</strong> {article.author or 'Unknown Author'}</p>
-                <p><strong>Published:</strong> {article.published or 'Unknown Date'}</p>
-                <p><a href="{article.link}">Read original article</a></p>
-                <hr>
-                <p>
-                    {article.text if article_type == "Full" else (
-                        article.summary or 'No content available.'
-                        )}
-                </p>
-                """
-                feed_chapter.content += article_content
-
-                # Add article to TOC only if article_type is "Full"
-                if article_type == "Full":
-                    article_link = epub.Link(
-                        href=f"{feed_title.replace(' ', '_')}.xhtml#{article_id}",
-                        title=article_title,
-                        uid=article_id
-                    )
-                    feed_toc.append(article_link)
-
-            # Add the feed chapter to the book
-            book.add_item(feed_chapter)
-            chapters.append(feed_chapter)
-
-            # Add the feed and its articles to the TOC
-            if feed_toc:
-                toc.append((epub.Section(feed_title), feed_toc))
-            else:
-                toc.append(epub.Section(feed_title))
-
-        # Add navigation and spine
-        self.logger.info("Adding navigation and styling...")
-
-        try:
-            book.toc = toc
-            book.add_item(epub.EpubNcx())
-            book.add_item(epub.EpubNav())
-
-            book.spine = ["nav"] + chapters
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            self.logger.error(
-                "Failed to configure navigation and styling: %s", e)
-            return
-
-        # Write the book to a file
-        try:
-            epub.write_epub(output_file, book)
-            self.logger.info(
-                "EPUB file successfully saved to %s.", output_file)
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            self.logger.error("Failed to save EPUB file: %s", e)
+                    "EPUB file successfully saved to %s.", output_file)
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                self.logger.error("Failed to save EPUB file: %s", e)
+        finally:
+            writer.close()
 
         self.logger.info("EPUB generation completed successfully.")
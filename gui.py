@@ -10,19 +10,26 @@ import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
 import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import ttkbootstrap as tb
 
-from feedhandler import FeedHandler, FeedConfig
+from feedhandler import FeedHandler, FeedConfig, _json_loads, _json_dumps
 from generator import EpubGenerator
 
 # Import the logger setup function
 from logger import _setup_logger
 
+# How often the GUI checks whether a background EPUB generation has finished
+GENERATION_POLL_MS = 100
+
 
 class GazetteGUI:
     """The main class, here the magic gets drawn"""
 
+    # ttkbootstrap's themes don't change while the app runs, look them up once
+    _themes: tuple[str, ...] | None = None
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("RSS-Gazette")
@@ -30,6 +37,8 @@ class GazetteGUI:
         self.handler = FeedHandler("configs/feeds.json")
         self.generator = EpubGenerator()
         self.settings_file = "configs/settings.json"
+        # Runs EPUB generation away from the Tk event loop, one book at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
 
         # Create a logger for this class
         self.logger = _setup_logger("GazetteeGUI")
@@ -126,6 +135,9 @@ class GazetteGUI:
         self.tree.column("Articles", anchor="center")
         self.tree.grid(row=1, column=0, columnspan=2,
                        sticky="nsew", padx=10, pady=5)
+        self.tree.bind("<ButtonRelease-1>", self.load_selected_feed)
+        # (iid, name, url, articles) of each row currently in the list
+        self._shown_rows: list[tuple] = []
 
         self.refresh_feed_list()
 
@@ -226,9 +238,12 @@ class GazetteGUI:
             os.makedirs(config_dir)
             self.logger.info("Created directory: %s", config_dir)
 
-    def get_available_themes(self) -> list[str]:
-        """Get a list of available ttkbootstrap themes."""
-        return tb.Style().theme_names()
+    def get_available_themes(self) -> tuple[str, ...]:
+        """Get the available ttkbootstrap themes."""
+        if GazetteGUI._themes is None:
+            # The window already owns a Style, don't build another one
+            GazetteGUI._themes = tuple(self.root.style.theme_names())
+        return GazetteGUI._themes
 
     # pylint: disable=unused-argument
     def change_theme(self, event) -> None:
@@ -242,19 +257,18 @@ class GazetteGUI:
         url = self.url_entry.get()
         name = self.name_entry.get() or "Unnamed Feed"
         num_articles = int(self.num_entry.get() or 5)
-        if not url.startswith("http://") and not url.startswith("https://"):
+        if not url.startswith(("http://", "https://")):
             messagebox.showerror(
                 "Input Error", "Please enter a valid URL starting with http:// or https://")
             self.logger.error("Invalid feed URL format: %s", url)
             return
         # Check for duplicates
-        for feed in self.handler.feeds_data:
-            if feed.url == url:
-                messagebox.showerror(
-                    "Duplicate Error", "Feed URL already exists!")
-                self.logger.error(
-                    "Attempted to add a duplicate feed with URL: %s", url)
-                return
+        if self.handler.has_feed(url):
+            messagebox.showerror(
+                "Duplicate Error", "Feed URL already exists!")
+            self.logger.error(
+                "Attempted to add a duplicate feed with URL: %s", url)
+            return
         new_feed = FeedConfig(url=url, name=name, num_articles=num_articles)
         self.handler.add_feed(new_feed)
         messagebox.showinfo("Success", "Feed added successfully!")
@@ -273,22 +287,30 @@ class GazetteGUI:
                 "Attempted to edit a feed without selecting one.")
             return
 
-        # Get selected feed
-        feed_url = self.tree.item(selected_item, "values")[1]
-        for feed in self.handler.feeds_data:
-            if feed.url == feed_url:
-                # Update feed with current input
-                feed.name = self.name_entry.get() or feed.name
-                feed.num_articles = int(
-                    self.num_entry.get() or feed.num_articles)
-                feed.url = self.url_entry.get() or feed.url
-                self.handler.update_feed(feed_url, feed)
-                messagebox.showinfo("Success", "Feed updated successfully!")
-                self.logger.info("Updated feed: %s (%s) with %d articles",
-                                 feed.name, feed.url, feed.num_articles)
-                self.clear_inputs()
-                self.refresh_feed_list()
-                return
+        # Get selected feed, rows are keyed by feed URL
+        feed_url = selected_item[0]
+        feed = self.handler.get_feed(feed_url)
+        if feed is None:
+            return
+        new_url = self.url_entry.get() or feed.url
+        if new_url != feed_url and self.handler.has_feed(new_url):
+            messagebox.showerror(
+                "Duplicate Error", "Feed URL already exists!")
+            self.logger.error(
+                "Attempted to rename a feed to a duplicate URL: %s", new_url)
+            return
+
+        # Update feed with current input
+        feed.name = self.name_entry.get() or feed.name
+        feed.num_articles = int(
+            self.num_entry.get() or feed.num_articles)
+        feed.url = new_url
+        self.handler.update_feed(feed_url, feed)
+        messagebox.showinfo("Success", "Feed updated successfully!")
+        self.logger.info("Updated feed: %s (%s) with %d articles",
+                         feed.name, feed.url, feed.num_articles)
+        self.clear_inputs()
+        self.refresh_feed_list()
 
     def delete_feed(self) -> None:
         """Delete the selected feed."""
@@ -298,34 +320,49 @@ class GazetteGUI:
             self.logger.warning(
                 "Attempted to delete a feed without selecting one.")
             return
-        feed_url = self.tree.item(selected_item, "values")[1]
+        feed_url = selected_item[0]
         self.handler.remove_feed(feed_url)
         messagebox.showinfo("Success", "Feed deleted successfully!")
         self.logger.info("Deleted feed with URL: %s", feed_url)
         self.refresh_feed_list()
 
     def generate_epub(self) -> None:
-        """Generate the EPUB file."""
+        """Start generating the EPUB file in the background."""
         output_file = filedialog.asksaveasfilename(
             defaultextension=".epub", filetypes=[("EPUB files", "*.epub")]
         )
         if not output_file:
             self.logger.warning("EPUB generation canceled by user.")
             return
+        article_type = self.settings.get("article_type", "Summary")  # Default to Summary
+        self.logger.info("Article type from settings: %s", article_type)
+        if article_type not in ["Full", "Summary"]:
+            self.logger.error("Unknown article type: %s", article_type)
+            messagebox.showerror("Error", f"Unknown article type: {article_type}")
+            return
+
+        self.logger.info("Generating EPUB with type = %s.", article_type)
+        # Fetching and building the book takes seconds, run it off the Tk thread so
+        # the window keeps responding. The worker reads the feeds and stores their
+        # new ETag/Last-Modified values in place, so the feed list stays locked
+        # until it is done.
+        self._set_feed_controls("disabled")
+        future = self._executor.submit(
+            self.generator.generate_epub,
+            self.handler.feeds_data,
+            self.handler, output_file,
+            article_type=article_type)
+        self.root.after(GENERATION_POLL_MS, self._finish_generation, future, output_file)
+
+    def _finish_generation(self, future: Future, output_file: str) -> None:
+        """Report the outcome of a background EPUB generation once it is done."""
+        # Tk may only be touched from its own thread, so poll instead of using a callback
+        if not future.done():
+            self.root.after(GENERATION_POLL_MS, self._finish_generation, future, output_file)
+            return
+        self._set_feed_controls("normal")
         try:
-            article_type = self.settings.get("article_type", "Summary")  # Default to Summary
-            self.logger.info("Article type from settings: %s", article_type)
-            if article_type not in ["Full", "Summary"]:
-                self.logger.error("Unknown article type: %s", article_type)
-                messagebox.showerror("Error", f"Unknown article type: {article_type}")
-                return
-
-            else:
-                self.logger.info("Generating EPUB with type = %s.", article_type)
-                self.generator.generate_epub(
-                    self.handler.feeds_data,
-                    self.handler, output_file,
-                    article_type=article_type)
+            future.result()
             messagebox.showinfo("Success", f"EPUB generated: {output_file}")
             self.logger.info("Generated EPUB: %s", output_file)
 
@@ -334,14 +371,40 @@ class GazetteGUI:
             messagebox.showerror("Error", f"Failed to generate EPUB: {e}")
             self.logger.error("Failed to generate EPUB: %s", e)
 
+    def _set_feed_controls(self, state: str) -> None:
+        """Enable or disable the buttons that change the feeds or generate a book."""
+        for button in (self.add_btn, self.edit_btn, self.del_btn, self.gen_btn):
+            button.configure(state=state)
+
     def refresh_feed_list(self) -> None:
-        """Refresh the feed list display."""
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        for feed in self.handler.feeds_data:
-            self.tree.insert("", tk.END, values=(
-                feed.name, feed.url, feed.num_articles))
-        self.tree.bind("<ButtonRelease-1>", self.load_selected_feed)
+        """Refresh the feed list display, touching only the rows that changed."""
+        rows = [(feed.url, feed.name, feed.url, feed.num_articles)
+                for feed in self.handler.feeds_data]
+        shown = self._shown_rows
+
+        # Feeds keep their place unless one is removed or its URL changes, so
+        # rows matching by id are updated in place where their values differ
+        i = 0
+        while i < min(len(shown), len(rows)) and shown[i][0] == rows[i][0]:
+            if shown[i] != rows[i]:
+                self.tree.item(rows[i][0], values=rows[i][1:])
+            i += 1
+
+        # Everything after the first mismatch is rebuilt off screen so it's only laid out once
+        if i < len(shown) or i < len(rows):
+            self.tree.grid_remove()
+            if i < len(shown):
+                self.tree.delete(*(row[0] for row in shown[i:]))
+            # Insert the new rows from a single Tcl foreach instead of one call per feed,
+            # they go over as one flat Tcl list so no value needs quoting by hand
+            tail = tuple(value for row in rows[i:] for value in row)
+            if tail:
+                self.tree.tk.call(
+                    "foreach", ("iid", "name", "url", "num"), tail,
+                    f"{self.tree} insert {{}} end -id $iid -values [list $name $url $num]")
+            self.tree.grid()
+
+        self._shown_rows = rows
         self.logger.debug("Refreshed feed list.")
 
     # pylint: disable=unused-argument
@@ -370,9 +433,9 @@ class GazetteGUI:
         """Load settings from a JSON file."""
         if os.path.exists(self.settings_file):
             try:
-                with open(self.settings_file, 'r', encoding='utf-8') as file:
-                    settings = json.load(file)
-                self.logger.info("Loaded settings: %s", settings)
+                with open(self.settings_file, 'rb') as file:
+                    settings = _json_loads(file.read())
+                self.logger.info("Loaded settings from %s", self.settings_file)
                 return settings
             except (FileNotFoundError, json.JSONDecodeError) as e:
                 self.logger.error("Error loading settings: %s", e)
@@ -423,11 +486,11 @@ class GazetteGUI:
 
         # Save settings to JSON file
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as file:
-                json.dump(settings, file, indent=4)
-            self.logger.info("Saved settings: %s", settings)
-            self.settings = self.load_settings()
-            self.logger.info("Loaded newly saved settings.")
+            with open(self.settings_file, 'wb') as file:
+                file.write(_json_dumps(settings))
+            self.logger.info("Saved settings to %s", self.settings_file)
+            # The file now holds exactly this dict, no need to read it back
+            self.settings = settings
             messagebox.showinfo("Success", "Settings saved successfully!")
         # pylint: disable=broad-exception-caught
         except Exception as e:
@@ -3,18 +3,54 @@ Logging machinery to be used across all other modules.
 """
 
 import logging
+import logging.handlers
 import os
+import queue
+import atexit
+from functools import lru_cache
 
 LOG_DIR = "logs"
 
 # Ensure the log directory exists
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
+os.makedirs(LOG_DIR, exist_ok=True)
 
+# Formatters and the console handler are the same for every logger, build them once
+_CONSOLE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(levelname)s - %(message)s"
+)
+_CONSOLE_HANDLER = logging.StreamHandler()
+_CONSOLE_HANDLER.setFormatter(_CONSOLE_FORMATTER)
+
+# File handler of each logger, keyed by logger name
+_FILE_HANDLERS: dict[str, logging.Handler] = {}
+
+
+class _FileRouter(logging.Handler):
+    """Hands each record to the file handler of the logger that emitted it."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = _FILE_HANDLERS.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+
+# Loggers only put records on a queue, a single background thread does the
+# console and file writes, so worker threads never wait on I/O to log
+_LOG_QUEUE = queue.SimpleQueue()
+_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _CONSOLE_HANDLER, _FileRouter())
+_LISTENER.start()
+# Runs before logging's own shutdown, which then closes the log files
+atexit.register(_LISTENER.stop)
+
+@lru_cache(maxsize=None)
 def _setup_logger(name: str) -> logging.Logger:
     """
     Create and return a logger with the given name.
     Each logger will log to a separate file based on the module name.
+    Records are written by a background thread as they come in.
     """
     logger = logging.getLogger(name)
 
@@ -22,21 +58,14 @@ def _setup_logger(name: str) -> logging.Logger:
     if not logger.hasHandlers():
         logger.setLevel(logging.INFO)
 
-        # Console Handler (shared across all modules)
-        console_handler = logging.StreamHandler()
-        console_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
-
         # File Handler (separate file for each module)
         log_file = os.path.join(LOG_DIR, f"{name}.log")
         file_handler = logging.FileHandler(log_file)
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s"
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FILE_FORMATTER)
+        _FILE_HANDLERS[name] = file_handler
+
+        # Console Handler (shared across all modules) and the file handler both
+        # sit behind the queue
+        logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
 
     return logger
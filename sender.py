@@ -6,15 +6,99 @@ To automate this, you'll need to create a cron job, or a Windows schedule, or wh
 import os
 import sys
 import json
+import atexit
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+import threading
+from email.message import EmailMessage
 from datetime import date
 
-from feedhandler import FeedHandler
+from feedhandler import FeedHandler, _json_loads, _json_dumps
 from generator import EpubGenerator
 from logger import _setup_logger
 
+# Seconds to wait for the SMTP server before giving up
+SMTP_TIMEOUT = 30
+# Settings the mail can't be sent without
+REQUIRED_MAIL_SETTINGS = ("smtp_server", "smtp_port", "smtp_username",
+                          "smtp_password", "target_email")
+
+
+class MailSender:
+    """Sends mail through one authenticated SMTP connection, opened ahead of time.
+
+    warm_up() opens the connection on a background thread, so the TCP, TLS and
+    AUTH round trips overlap with building the newspaper. send() reuses that
+    connection, and reconnects once if the server dropped it in the meantime.
+    """
+
+    def __init__(self, server: str, port: int, username: str, password: str, logger):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.logger = logger
+        self._smtp: smtplib.SMTP | None = None
+        self._lock = threading.Lock()
+        self._warm_up_thread: threading.Thread | None = None
+
+    def warm_up(self) -> None:
+        """Start connecting and logging in on a background thread."""
+        self._warm_up_thread = threading.Thread(
+            target=self._warm_up, name="SMTPWarmUp", daemon=True)
+        self._warm_up_thread.start()
+
+    def _warm_up(self) -> None:
+        """Connect ahead of time, leaving any error for send() to retry and report."""
+        try:
+            self._connect()
+        except (smtplib.SMTPException, OSError) as e:
+            self.logger.warning("Could not connect to the SMTP server ahead of time: %s", e)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new connection, replacing any previous one."""
+        with self._lock:
+            self._close()
+            smtp = smtplib.SMTP(self.server, self.port, timeout=SMTP_TIMEOUT)
+            try:
+                smtp.starttls()
+                smtp.login(self.username, self.password)
+            except BaseException:
+                smtp.close()
+                raise
+            self._smtp = smtp
+            return smtp
+
+    def send(self, msg) -> None:
+        """Send a message over the open connection, reconnecting if it went stale."""
+        if self._warm_up_thread is not None:
+            self._warm_up_thread.join()
+            self._warm_up_thread = None
+        smtp = self._smtp
+        if smtp is not None:
+            try:
+                smtp.noop()
+                smtp.send_message(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                self.logger.info("SMTP connection was closed by the server, reconnecting")
+        self._connect().send_message(msg)
+
+    def close(self) -> None:
+        """Log out and close the connection, if one is open."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        """Close the connection, the caller must hold the lock."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+
 def main():
     """
     Generate an EPUB file from RSS feeds and send it via email.
@@ -26,7 +110,6 @@ def main():
     """
     logger = _setup_logger("Sender")
     settings_path = "configs/settings.json"
-    os.makedirs("configs", exist_ok=True)
 
     # Verify settings.json exists and is valid
     if not os.path.isfile(settings_path):
@@ -34,9 +117,9 @@ def main():
         print("Please run the GUI to configure settings first")
         sys.exit(1)
 
-    with open(settings_path, 'r', encoding='utf-8') as f:
+    with open(settings_path, 'rb') as f:
         try:
-            settings = json.load(f)
+            settings = _json_loads(f.read())
         except json.JSONDecodeError as e:
             logger.error("Failed to parse settings.json: %s", e)
             print("Error in settings.json. Please run the GUI to configure settings again.")
@@ -45,15 +128,34 @@ def main():
     # Verify feeds.json exists and create if necessary
     feeds_path = "configs/feeds.json"
     if not os.path.isfile(feeds_path):
-        with open(feeds_path, 'w', encoding='utf-8') as f:
-            json.dump([], f)
+        # configs/ exists, settings.json was found in it
+        with open(feeds_path, 'wb') as f:
+            f.write(_json_dumps([]))
         logger.error("Feeds file not found")
         print("Please run the GUI to configure settings first")
         sys.exit(1)
 
+    # Verify the mail settings are complete before any work depends on them
+    if not isinstance(settings, dict):
+        settings = {}
+    missing = [key for key in REQUIRED_MAIL_SETTINGS if not settings.get(key)]
+    if missing:
+        logger.error("Missing settings in settings.json: %s", ", ".join(missing))
+        print("Error in settings.json. Please run the GUI to configure settings again.")
+        sys.exit(1)
+
+    # Log in to the mail server while the newspaper is being built
+    mailer = MailSender(settings['smtp_server'], settings['smtp_port'],
+                        settings['smtp_username'], str(settings['smtp_password']).strip(),
+                        logger)
+    mailer.warm_up()
+    atexit.register(mailer.close)
+
     handler = FeedHandler(feeds_path)
     generator = EpubGenerator()
-    output_file = f"newspapers/newspaper_{date.today().isoformat()}.epub"
+    today = date.today().isoformat()
+    output_name = f"newspaper_{today}.epub"
+    output_file = f"newspapers/{output_name}"
 
     os.makedirs("newspapers", exist_ok=True)
 
@@ -63,7 +165,8 @@ def main():
             feeds=handler.feeds_data,
             handler=handler,
             output_file=output_file,
-            article_type=settings['article_type']
+            # Same default as the GUI when the key is missing
+            article_type=settings.get('article_type', 'Summary')
         )
     # pylint: disable=broad-exception-caught
     except Exception as e:
@@ -78,25 +181,21 @@ def main():
 
     # Send the EPUB via email
     try:
-        msg = MIMEMultipart()
-        msg['Subject'] = f'Your Daily EPUB Newspaper - {date.today().isoformat()}'
+        msg = EmailMessage()
+        msg['Subject'] = f'Your Daily EPUB Newspaper - {today}'
         msg['From'] = settings['smtp_username']
         msg['To'] = settings['target_email']
 
         with open(output_file, 'rb') as f:
-            attachment = MIMEApplication(f.read(), _subtype='epub')
-            attachment.add_header(
-                'Content-Disposition',
-                'attachment',
-                filename=os.path.basename(output_file)
+            msg.add_attachment(
+                f.read(),
+                maintype='application',
+                subtype='epub+zip',
+                filename=output_name
             )
-            msg.attach(attachment)
 
         try:
-            with smtplib.SMTP(settings['smtp_server'], settings['smtp_port']) as smtp:
-                smtp.starttls()
-                smtp.login(settings['smtp_username'], settings['smtp_password'].strip())
-                smtp.send_message(msg)
+            mailer.send(msg)
 
             logger.info("EPUB sent successfully via email")
         except (smtplib.SMTPException, ConnectionError) as e:
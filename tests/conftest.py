@@ -0,0 +1,65 @@
+"""
+Shared test setup: the modules live at the top of the repository, next to this folder.
+"""
+import json
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from feedhandler import FeedHandler
+
+
+@pytest.fixture
+def make_handler(tmp_path):
+    """Build FeedHandlers on a feeds.json in a temporary directory, optionally prefilled."""
+    handlers = []
+
+    def make(feeds: list[dict] | None = None) -> FeedHandler:
+        json_path = tmp_path / "configs" / "feeds.json"
+        if feeds is not None:
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            json_path.write_text(json.dumps(feeds), encoding="utf-8")
+        handler = FeedHandler(str(json_path))
+        handlers.append(handler)
+        return handler
+
+    yield make
+    for handler in handlers:
+        handler.flush()
+        handler._article_cache.close()  # pylint: disable=protected-access
+
+
+class FakeWeb:
+    """Canned responses for requests.Session.get, keyed by URL, and a log of the GETs made."""
+
+    def __init__(self):
+        # URL -> (status code, body, response headers)
+        self.responses: dict[str, tuple[int, bytes, dict]] = {}
+        # (URL, request headers) of every GET, in order
+        self.calls: list[tuple[str, dict]] = []
+
+    # pylint: disable=unused-argument
+    def get(self, url, headers=None, timeout=None, **kwargs) -> requests.Response:
+        """Stand in for Session.get, answering from the canned responses."""
+        self.calls.append((url, dict(headers or {})))
+        status, body, response_headers = self.responses[url]
+        response = requests.Response()
+        response.status_code = status
+        response._content = body  # pylint: disable=protected-access
+        response.headers.update(response_headers)
+        response.url = url
+        return response
+
+
+@pytest.fixture
+def fake_web(monkeypatch):
+    """Route every requests.Session.get to a FakeWeb instead of the network."""
+    web = FakeWeb()
+    monkeypatch.setattr(requests.Session, "get",
+                        lambda session, url, **kwargs: web.get(url, **kwargs))
+    return web
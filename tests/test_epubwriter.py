@@ -0,0 +1,82 @@
+"""
+Tests for the streaming EPUB writer.
+"""
+import zipfile
+
+from ebooklib import epub
+
+from epubwriter import StreamingEpubWriter
+
+
+def _build_book(path: str, chapters: list[tuple[str, str]]) -> None:
+    """Write a book the way EpubGenerator does, streaming each chapter as it is built."""
+    book = epub.EpubBook()
+    book.set_title("Test Newspaper")
+    book.set_language("en")
+    book.add_item(epub.EpubItem(uid="style_nav", file_name="style/nav.css",
+                                media_type="text/css", content=b"body { }"))
+    writer = StreamingEpubWriter(path + ".part", book)
+    try:
+        chapter_ids = []
+        for title, body in chapters:
+            chapter = epub.EpubHtml(title=title, file_name=f"{title}.xhtml")
+            chapter.content = body
+            book.add_item(chapter)
+            writer.write_item(chapter)
+            chapter_ids.append(chapter.id)
+        # Shaped like a Full book's TOC: each feed's section with its article links
+        book.toc = [(epub.Section(title), [epub.Link(f"{title}.xhtml#story",
+                                                     f"{title} story", f"{title}_story")])
+                    for title, _ in chapters]
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        book.spine = ("nav", *chapter_ids)
+        writer.finish(path)
+    finally:
+        writer.close()
+
+
+def test_streamed_chapters_read_back(tmp_path):
+    path = str(tmp_path / "book.epub")
+    _build_book(path, [("First", "<h1>First</h1><p>Alpha body</p>"),
+                       ("Second", "<h1>Second</h1><p>Beta body</p>")])
+
+    book = epub.read_epub(path)
+    first = book.get_item_with_href("First.xhtml")
+    second = book.get_item_with_href("Second.xhtml")
+    assert b"Alpha body" in first.get_body_content()
+    assert b"Beta body" in second.get_body_content()
+
+    nav = book.get_item_with_href("nav.xhtml").get_content()
+    assert b'href="First.xhtml#story"' in nav and b'href="Second.xhtml#story"' in nav
+    ncx = book.get_item_with_href("toc.ncx").get_content()
+    assert b"First story" in ncx and b"Second story" in ncx
+    assert [item_id for item_id, _ in book.spine] == ["nav", "chapter_0", "chapter_1"]
+    assert not (tmp_path / "book.epub.part").exists()
+
+
+def test_archive_layout(tmp_path):
+    path = str(tmp_path / "book.epub")
+    _build_book(path, [("Only", "<p>Body</p>")])
+
+    with zipfile.ZipFile(path) as archive:
+        infos = archive.infolist()
+        names = [info.filename for info in infos]
+    # The mimetype comes first and uncompressed, and nothing is written twice
+    assert names[0] == "mimetype"
+    assert infos[0].compress_type == zipfile.ZIP_STORED
+    assert len(names) == len(set(names))
+    assert "EPUB/Only.xhtml" in names
+
+
+def test_close_without_finish_discards_the_archive(tmp_path):
+    book = epub.EpubBook()
+    part = tmp_path / "book.epub.part"
+    writer = StreamingEpubWriter(str(part), book)
+    chapter = epub.EpubHtml(title="Chapter", file_name="chapter.xhtml")
+    chapter.content = "<p>Body</p>"
+    book.add_item(chapter)
+    writer.write_item(chapter)
+    writer.close()
+    assert not part.exists()
+    assert not (tmp_path / "book.epub").exists()
@@ -0,0 +1,308 @@
+"""
+Tests for the feed handler.
+"""
+import json
+import os
+
+import feedparser
+import pytest
+
+import feedhandler
+from feedhandler import FeedConfig, _fast_parse
+
+FEED_URL = "https://example.com/feed/"
+
+RSS_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item>
+  <title>First</title>
+  <link>/posts/first</link>
+  <description>&lt;p onclick="steal()"&gt;Hello &lt;a href="/about"&gt;about&lt;/a&gt;
+  &lt;img src="img/pic.png" onerror="steal()"&gt;
+  &lt;script&gt;alert(1)&lt;/script&gt;&lt;/p&gt;</description>
+</item>
+</channel></rss>"""
+
+ATOM_FEED = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Example</title>
+<entry>
+  <title>Html</title>
+  <link href="posts/html"/>
+  <summary type="html">&lt;p onmouseover="steal()"&gt;Hello &lt;a href="/about"&gt;about&lt;/a&gt;
+  &lt;script&gt;alert(1)&lt;/script&gt;&lt;/p&gt;</summary>
+</entry>
+<entry>
+  <title>Xhtml</title>
+  <link href="posts/xhtml"/>
+  <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">
+    <p onclick="steal()">Hello <a href="about">about</a></p><script>alert(2)</script>
+  </div></content>
+</entry>
+<entry>
+  <title>Text</title>
+  <link href="posts/text"/>
+  <summary>1 &lt; 2 &lt;b&gt;</summary>
+</entry>
+</feed>"""
+
+
+def _assert_clean(summary: str) -> None:
+    """Check a summary carries no scripts or event handler attributes."""
+    assert "<script" not in summary
+    assert "alert(" not in summary
+    assert " on" not in summary
+    assert "steal()" not in summary
+
+
+def test_fast_parse_sanitises_rss_descriptions():
+    [entry] = _fast_parse(RSS_FEED, FEED_URL)
+    _assert_clean(entry["summary"])
+    assert entry["link"] == "https://example.com/posts/first"
+    assert '<a href="https://example.com/about">about</a>' in entry["summary"]
+    assert 'src="https://example.com/feed/img/pic.png"' in entry["summary"]
+
+
+def test_fast_parse_sanitises_atom_content():
+    html_entry, xhtml_entry, text_entry = _fast_parse(ATOM_FEED, FEED_URL)
+
+    _assert_clean(html_entry["summary"])
+    assert html_entry["link"] == "https://example.com/feed/posts/html"
+    assert '<a href="https://example.com/about">about</a>' in html_entry["summary"]
+
+    _assert_clean(xhtml_entry["summary"])
+    assert '<a href="https://example.com/feed/about">about</a>' in xhtml_entry["summary"]
+
+    # Plain text is escaped, not interpreted as markup
+    assert text_entry["summary"] == "1 &lt; 2 &lt;b&gt;"
+
+
+# Well-formed feeds exercising every field the fast path reads
+PARITY_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel><title>Example</title>
+<item>
+  <title>First &amp; best</title>
+  <link>https://example.com/posts/1</link>
+  <description>&lt;p&gt;Hello &lt;a href="/about"&gt;about&lt;/a&gt;&lt;/p&gt;</description>
+  <pubDate>Mon, 12 Oct 2026 08:00:00 GMT</pubDate>
+  <dc:creator>Jane Doe</dc:creator>
+</item>
+<item>
+  <title>Second</title>
+  <guid>https://example.com/posts/2</guid>
+  <description>Plain words</description>
+  <pubDate>Tue, 13 Oct 2026 08:00:00 GMT</pubDate>
+  <author>john@example.com (John Doe)</author>
+</item>
+<item>
+  <title>Relative</title>
+  <link>posts/3</link>
+</item>
+</channel></rss>"""
+
+PARITY_ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Example</title>
+<entry>
+  <title>One</title>
+  <link rel="enclosure" href="audio.mp3"/>
+  <link rel="alternate" href="posts/1"/>
+  <summary type="html">&lt;p&gt;Hello &lt;img src="pic.png"&gt;&lt;/p&gt;</summary>
+  <published>2026-10-12T08:00:00Z</published>
+  <author><name>Jane Doe</name></author>
+</entry>
+<entry>
+  <title>Two</title>
+  <link href="https://other.example/2"/>
+  <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">
+    <p>Hi <a href="a">a</a></p>
+  </div></content>
+  <updated>2026-10-13T08:00:00Z</updated>
+</entry>
+</feed>"""
+
+
+@pytest.mark.parametrize("data", [PARITY_RSS, PARITY_ATOM], ids=["rss", "atom"])
+def test_fast_parse_matches_feedparser(data):
+    fast = _fast_parse(data, FEED_URL)
+    slow = feedparser.parse(data, response_headers={"content-location": FEED_URL}).entries
+
+    assert len(fast) == len(slow)
+    for fast_entry, slow_entry in zip(fast, slow):
+        for key in ("title", "link", "summary", "published", "author"):
+            assert fast_entry.get(key) == (slow_entry.get(key) or None), key
+
+
+def test_fast_parse_leaves_other_formats_to_feedparser():
+    rdf = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"><channel><title>Example</title></channel></rdf:RDF>"""
+    assert _fast_parse(rdf, FEED_URL) is None
+
+
+def test_save_replaces_the_file_atomically(make_handler, monkeypatch):
+    handler = make_handler([{"url": "https://example.com/a", "name": "A"}])
+    json_path = handler.json_path
+    with open(json_path, "rb") as file:
+        original = file.read()
+
+    handler.feeds_data[0].name = "Renamed"
+    handler.save_feeds()
+    with open(json_path, "rb") as file:
+        assert json.loads(file.read())[0]["name"] == "Renamed"
+    assert not os.path.exists(json_path + ".tmp")
+
+    # A write that fails before the rename leaves the previous file untouched
+    with open(json_path, "rb") as file:
+        saved = file.read()
+    assert saved != original
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    handler.feeds_data[0].name = "Lost"
+    with pytest.raises(OSError):
+        handler.save_feeds()
+    with open(json_path, "rb") as file:
+        assert file.read() == saved
+
+
+def test_save_skips_unchanged_feeds(make_handler, monkeypatch):
+    handler = make_handler([{"url": "https://example.com/a", "name": "A"}])
+    replaced = []
+    real_replace = os.replace
+
+    def counting_replace(src, dst):
+        replaced.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", counting_replace)
+    handler.save_feeds()
+    handler.save_feeds()
+    assert len(replaced) == 1
+
+    handler.feeds_data[0].num_articles = 9
+    handler.save_feeds()
+    assert len(replaced) == 2
+
+    # A file changed behind the handler's back is written again. Its mtime is
+    # moved on explicitly, a rewrite within the same clock tick would keep it
+    with open(handler.json_path, "wb") as file:
+        file.write(b"[]")
+    mtime_ns = os.stat(handler.json_path).st_mtime_ns + 1_000_000_000
+    os.utime(handler.json_path, ns=(mtime_ns, mtime_ns))
+    handler.save_feeds()
+    assert len(replaced) == 3
+
+
+def _assert_index_consistent(handler) -> None:
+    """Check the URL index points at every feed, and only at them."""
+    # pylint: disable=protected-access
+    assert handler._url_index == {feed.url: i for i, feed in enumerate(handler.feeds_data)}
+
+
+def test_url_index_follows_add_remove_and_update(make_handler):
+    handler = make_handler()
+    for name in "abcd":
+        handler.add_feed(FeedConfig(url=f"https://example.com/{name}", name=name))
+    _assert_index_consistent(handler)
+
+    handler.remove_feed("https://example.com/b")
+    _assert_index_consistent(handler)
+    assert not handler.has_feed("https://example.com/b")
+    assert handler.get_feed("https://example.com/c").name == "c"
+
+    # Same URL, new settings
+    handler.update_feed("https://example.com/c",
+                        FeedConfig(url="https://example.com/c", name="C", num_articles=2))
+    _assert_index_consistent(handler)
+    assert handler.get_feed("https://example.com/c").name == "C"
+
+    # New URL, same place in the list
+    handler.update_feed("https://example.com/d",
+                        FeedConfig(url="https://example.com/e", name="e"))
+    _assert_index_consistent(handler)
+    assert not handler.has_feed("https://example.com/d")
+    assert [feed.name for feed in handler.feeds_data] == ["a", "C", "e"]
+
+    # Unknown URLs change nothing
+    handler.remove_feed("https://example.com/missing")
+    handler.update_feed("https://example.com/missing",
+                        FeedConfig(url="https://example.com/x", name="x"))
+    _assert_index_consistent(handler)
+    assert handler.get_feed("https://example.com/missing") is None
+    assert len(handler.feeds_data) == 3
+
+
+def test_duplicate_urls_are_dropped_on_load(make_handler):
+    handler = make_handler([
+        {"url": "https://example.com/a", "name": "First"},
+        {"url": "https://example.com/b", "name": "B"},
+        {"url": "https://example.com/a", "name": "Repeat"},
+    ])
+    _assert_index_consistent(handler)
+    assert [feed.name for feed in handler.feeds_data] == ["First", "B"]
+
+    # Removing the feed removes it for good, no hidden repeat takes its place
+    handler.remove_feed("https://example.com/a")
+    _assert_index_consistent(handler)
+    assert not handler.has_feed("https://example.com/a")
+
+    handler.save_feeds()
+    with open(handler.json_path, "rb") as file:
+        assert [feed["url"] for feed in json.loads(file.read())] == ["https://example.com/b"]
+
+
+def _titles(handler, feed) -> list[str]:
+    """Titles of the articles of a feed, summaries only."""
+    return [article.title for article in handler.iter_articles(feed, full_text=False)]
+
+
+def test_recent_entries_are_reused_within_the_ttl(make_handler, fake_web):
+    fake_web.responses[FEED_URL] = (200, PARITY_RSS, {"ETag": '"v1"'})
+    handler = make_handler()
+    feed = FeedConfig(url=FEED_URL, name="Example")
+
+    assert _titles(handler, feed) == ["First & best", "Second", "Relative"]
+    assert _titles(handler, feed) == ["First & best", "Second", "Relative"]
+    assert len(fake_web.calls) == 1
+
+
+def test_expired_entries_are_revalidated(make_handler, fake_web, monkeypatch):
+    monkeypatch.setattr(feedhandler, "FEED_CACHE_TTL", 0)
+    fake_web.responses[FEED_URL] = (200, PARITY_RSS, {"ETag": '"v1"'})
+    handler = make_handler()
+    feed = FeedConfig(url=FEED_URL, name="Example")
+    assert _titles(handler, feed) == ["First & best", "Second", "Relative"]
+
+    # Past the TTL the server is asked again, and a 304 reuses the entries cached on disk
+    fake_web.responses[FEED_URL] = (304, b"", {})
+    assert _titles(handler, feed) == ["First & best", "Second", "Relative"]
+    assert len(fake_web.calls) == 2
+    assert fake_web.calls[1][1]["If-None-Match"] == '"v1"'
+
+
+def test_recent_entries_are_bounded(make_handler, fake_web, monkeypatch):
+    monkeypatch.setattr(feedhandler, "FEED_CACHE_SIZE", 1)
+    other_url = "https://example.com/other/"
+    fake_web.responses[FEED_URL] = (200, PARITY_RSS, {})
+    fake_web.responses[other_url] = (200, PARITY_ATOM, {})
+    handler = make_handler()
+    feed = FeedConfig(url=FEED_URL, name="Example")
+    other = FeedConfig(url=other_url, name="Other")
+
+    _titles(handler, feed)
+    _titles(handler, other)
+    _titles(handler, other)
+    _titles(handler, feed)
+    assert [url for url, _ in fake_web.calls] == [FEED_URL, other_url, FEED_URL]
+
+
+def test_failed_fetches_are_not_kept(make_handler, fake_web):
+    fake_web.responses[FEED_URL] = (500, b"", {})
+    handler = make_handler()
+    feed = FeedConfig(url=FEED_URL, name="Example")
+    assert not _titles(handler, feed)
+
+    fake_web.responses[FEED_URL] = (200, PARITY_RSS, {})
+    assert _titles(handler, feed) == ["First & best", "Second", "Relative"]
+    assert len(fake_web.calls) == 2